@@ -77,7 +77,6 @@ import datetime
 import pathlib
 import urllib.parse
 import arrow
-import six
 import collections
 from past.builtins import basestring
 
@@ -110,7 +109,7 @@ BOOLEAN_FALSE_STR_LIST = ['false']
 EXTRA_SCHEMA_TYPE_MAPPING = (
     ('object', (dict, collections.OrderedDict, )),
     ('importable', string_types),
-    ('number', six.integer_types + (float, decimal.Decimal)),
+    ('number', (int, float, decimal.Decimal)),
     ('uri',  string_types + (pathlib.Path, urllib.parse.ParseResult)),
     ('path', string_types + (urllib.parse.ParseResult, pathlib.Path)),
     ('date', datetime_types + (datetime.date, )),
@@ -10,18 +10,15 @@ from __future__ import unicode_literals
 
 import logging
 import inspect
-import sys
 import functools
 import weakref
-import six
 import wrapt
 from wrapt import decorator
 
 from pprint import pformat
 from pyrsistent import pmap
-from python_jsonschema_objects.validators import ValidationError
 
-from .exceptions import InvalidValue
+from .exceptions import InvalidValue, ValidationError
 
 # about decorators and why using wrapt
 # https://hynek.me/articles/decorators/
@@ -100,6 +97,16 @@ def take_arrays(narg1=0, narg2=-1, flatten=False):
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(None)
+def _pjo_validation_error():
+    # python_jsonschema_objects is optional: if installed, its ValidationError is raised for invalid arguments
+    try:
+        from python_jsonschema_objects.validators import ValidationError
+        return ValidationError
+    except ImportError:
+        return None
+
+
 def assert_arg(arg, typ, **schema):
     """
     Decorator to add a schema to validate a given argument against a json-schema.
@@ -148,12 +155,17 @@ def assert_arg(arg, typ, **schema):
                     # must be a default value, assume it s correct!
                     pass
                     #raise Exception("error with argument definition (%s,%i)"%(arg_s, arg_i2))
-            except (ValidationError, InvalidValue) as er:
+            except Exception as er:
+                pjo_error = _pjo_validation_error()
+                if not isinstance(er, (ValidationError, InvalidValue)) \
+                        and not (pjo_error and isinstance(er, pjo_error)):
+                    raise
+                error = pjo_error or ValidationError
                 if arg_s in kwargs:
-                    raise ValidationError(
+                    raise error(
                         "%s=%r is not valid. %s" % (arg_s, kwargs[arg_s], er))
                 elif type(arg_i) is int and arg_i2 < len(args):
-                    raise ValidationError(
+                    raise error(
                         "%s=%r is not valid. %s" % (arg_s, args[arg_i2], er))
             return wrapped(*args, **kwargs)
 
@@ -206,18 +218,14 @@ def log_exceptions(method, instance, args, kwargs):
                     args, kwargs))
         return method(*args, **kwargs)
     except Exception as er:
-        etype, value, trace = sys.exc_info()
         if hasattr(instance, "_logger"):
             instance._logger.error(
                 "CALL %s",
                 _format_call_msg(
                     "%r.%s" % (instance, getattr(method, '__name__', 'unknown')),
                     args, kwargs) +
-                "\n\tERROR %s: %s" % (etype.__name__, value), exc_info=True)
-        try:
-            six.reraise(etype, value, trace)
-        finally:
-            del trace  # to avoid circular refs
+                "\n\tERROR %s: %s" % (type(er).__name__, er), exc_info=True)
+        raise
 
 
 @wrapt.decorator
@@ -232,16 +240,12 @@ def log_init(init, instance, args, kwargs):
     try:
         return init(*args, **kwargs)
     except Exception as er:
-        etype, value, trace = sys.exc_info()
         instance._logger.error(
             "CALL %s\n\tERROR: %s: %s",
             _format_call_msg(
                 "INIT <%s>.__init__" % instance.__class__.__name__, args,
-                kwargs), etype.__name__, value)
-        try:
-            six.reraise(etype, value, trace)
-        finally:
-            del trace  # to avoid circular refs
+                kwargs), type(er).__name__, er)
+        raise
 
 
 def assert_prop(*args2check):
@@ -5,7 +5,7 @@ import importlib
 from ngofile.list_files import list_files
 from ngofile.pathlist import PathList
 
-from .schemas import load_schema_file
+from .schemas import load_schema_file, _schema_folder_files
 from ..utils import Registry
 
 
@@ -107,7 +107,10 @@ def load_module_schemas(module="ngoschema", schemas_store=None):
         schemas_store = UriResolver.get_doc_store()
     if not schema_folder.exists():
         return schemas_store
-    for ms in list_files(schema_folder, "**.json", recursive=True):
+    files = _schema_folder_files.get(schema_folder)
+    if files is None:
+        files = _schema_folder_files[schema_folder] = list(list_files(schema_folder, "**.json", recursive=True))
+    for ms in files:
         try:
             load_schema_file(ms, schemas_store)
         except Exception as er:
@@ -8,22 +8,53 @@ licence: GPL3
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import os
+import re
+import sys
 import json
-import collections
 import pathlib
 import logging
 from builtins import str
 
 import inflection
-import six
 
 from jsonschema.exceptions import SchemaError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# dictionaries keep insertion order (python 3.7+): schemas are parsed in plain dicts
+_json_loads = orjson.loads if orjson else json.loads
+
+# parsed keys are interned (they are not by the json parsers): keyword lookups then match by identity
+_ID = sys.intern('$id')
+
+
+def _intern_keys(value):
+    if isinstance(value, dict):
+        return {sys.intern(k) if isinstance(k, str) else k: _intern_keys(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_intern_keys(v) for v in value]
+    return value
+
+
+# runs of characters replaced by a single separator in inflection.parameterize(title, '_')
+_TITLE_SEPARATORS = re.compile(r'[^A-Za-z0-9\-]+')
+
+
+def _title_uri(title):
+    # ascii titles need no transliteration: parameterize with a single substitution
+    if title.isascii():
+        return _TITLE_SEPARATORS.sub('_', title).strip('_').lower()
+    return inflection.parameterize(title, '_')
+
 
 def _id_of(schema):
-    return schema.get("$id", schema.get("id"))
+    return schema.get(_ID, schema.get("id"))
 
 
 def load_schema(schema, schemas_store=None):
@@ -40,7 +71,8 @@ def load_schema(schema, schemas_store=None):
     from ngoschema.resolvers.uri_resolver import UriResolver
     uri = _id_of(schema).rstrip('#')
     if not uri and "title" in schema:
-        uri = inflection.parameterize(six.text_type(schema["title"]), "_")
+        title = schema["title"]
+        uri = _title_uri(title if isinstance(title, str) else str(title))
     if not uri:
         raise SchemaError(
             "Impossible to load schema because `id (or `$id) and `title fields"
@@ -54,6 +86,19 @@ def load_schema(schema, schemas_store=None):
     return uri, schema
 
 
+# parsed schema files by real path, with their modification time
+_schema_files = {}
+
+# schema files found in the schemas folders already walked
+_schema_folder_files = {}
+
+
+def clear_schema_files_cache():
+    """Forget the parsed schema files and the walked schema folders, to force their reload."""
+    _schema_files.clear()
+    _schema_folder_files.clear()
+
+
 def load_schema_file(schema_path, schemas_store=None):
     """
     Load a schema from a file to the metaschema store
@@ -65,12 +110,18 @@ def load_schema_file(schema_path, schemas_store=None):
     :type schemas_store: dict
     :rtype: dict
     """
-    with open(str(schema_path), "rb") as f:
-        try:
-            schema = json.loads(f.read().decode("utf-8"), object_pairs_hook=collections.OrderedDict)
-            schema.setdefault('$id', pathlib.Path(schema_path).stem)
-            return load_schema(schema, schemas_store)
-        except Exception as er:
-            logger.error(schema_path)
-            logger.error(er, exc_info=True)
-            raise
+    path = os.path.realpath(str(schema_path))
+    mtime = os.stat(path).st_mtime_ns
+    cached = _schema_files.get(path)
+    # an unchanged file is not parsed again, a copy of the parsed document is registered
+    if cached and cached[0] == mtime:
+        return load_schema(dict(cached[1]), schemas_store)
+    try:
+        schema = _intern_keys(_json_loads(pathlib.Path(path).read_bytes()))
+        schema.setdefault(_ID, pathlib.Path(schema_path).stem)
+        _schema_files[path] = (mtime, schema)
+        return load_schema(dict(schema), schemas_store)
+    except Exception as er:
+        logger.error(schema_path)
+        logger.error(er, exc_info=True)
+        raise
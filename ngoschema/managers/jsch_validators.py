@@ -117,3 +117,13 @@ Draft201909Validator = create(
 default_meta_validator = Draft201909Validator(
     Draft201909Validator.META_SCHEMA,
     resolver=UriResolver.create(uri=settings.MS_URI))
+
+
+def first_error(validator, instance, schema=None):
+    """
+    Return the first validation error of an instance, or None if it is valid.
+
+    Validation stops at the first error: collecting (and sorting) all errors of
+    `iter_errors` is only worth it when all of them are reported.
+    """
+    return next(validator.iter_errors(instance, schema), None)
@@ -26,8 +26,9 @@ class RelationshipDescriptor:
         return obj.items_type(fk).resolve(ik, session=obj.session)
 
     def __set__(self, obj, value):
-        obj[self.pname] = value._identityKeys
-        pass
+        # set the foreign keys of the object (not the relationship itself, which would recurse)
+        for fk, ik in zip(self.rtype._foreignKeys, value._identityKeys):
+            obj[fk] = ik
 
 
 class RelationshipBuilder(GenericClassRegistry):
@@ -2,18 +2,24 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import sys
 import logging
 import copy
-from collections import OrderedDict, Mapping
+import json
+from collections import OrderedDict
+from collections.abc import Mapping
 from jsonschema.validators import extend
 from jsonschema.exceptions import UndefinedTypeCheck
 
 from ..utils import ReadOnlyChainMap, apply_through_collection, GenericClassRegistry
-from ngoschema.resolvers.uri_resolver import resolve_uri, scope
-from .jsch_validators import Draft201909Validator, default_meta_validator
+from ngoschema.resolvers.uri_resolver import UriResolver, resolve_uri, scope
+from .jsch_validators import Draft201909Validator, default_meta_validator, first_error
 
 logger = logging.getLogger(__name__)
 
+# interned as the keys of loaded schema documents
+_REF = sys.intern('$ref')
+
 
 def untype_schema(schema):
     """go through schema items to remove instances of classes of Type and retrieve their schema."""
@@ -29,15 +35,27 @@ def untype_schema(schema):
     return schema
 
 
+def copy_schema(schema):
+    """copy a schema by a json round trip, much faster than a deepcopy (used as fallback for non json values)."""
+    try:
+        return json.loads(json.dumps(schema))
+    except (TypeError, ValueError):
+        return copy.deepcopy(schema)
+
+
 class TypeBuilder(GenericClassRegistry):
     _registry = {}
     _type_registry = {}
+    _type_checks = {}
+    _meta_validators = {}
+    _validators = {}
     _on_construction = {}
 
     def register_type(self, type):
         """Decorator to register a protocol based class """
         def to_decorate(cls):
             self._type_registry[type] = cls
+            self._type_checks.pop(type, None)
             cls._type = type
             cls._schema = dict(cls._schema, type=cls._type)
             #if not cls._schema:
@@ -47,12 +65,23 @@ class TypeBuilder(GenericClassRegistry):
             return cls
         return to_decorate
 
-    def is_type(self, value, id):
-        """Reproduce is_type method of jsonschema.Type"""
+    def _type_check(self, id):
+        """Return the python type(s) to check instances of type `id` with, if a plain isinstance is enough."""
+        from ..protocols.checker import Checker
+        from ..types.type import Primitive
         t = self._type_registry.get(id)
         if not t:
             raise UndefinedTypeCheck(id)
-        return t.check(value, items=False, convert=False, validate=False)
+        py_type = t._pyType if t._check in (Checker._check, Primitive._check) else None
+        self._type_checks[id] = py_type
+        return py_type
+
+    def is_type(self, value, id):
+        """Reproduce is_type method of jsonschema.Type"""
+        py_type = self._type_checks[id] if id in self._type_checks else self._type_check(id)
+        if py_type:
+            return isinstance(value, py_type)
+        return self._type_registry[id].check(value, items=False, convert=False, validate=False)
 
     def detect_type(self, value):
         for k, t in self._type_registry.items():
@@ -80,9 +109,9 @@ class TypeBuilder(GenericClassRegistry):
             return _False()
         attrs = attrs or {}
         self._on_construction[id] = (schema, bases, attrs)
-        if '$ref' in schema:
+        if _REF in schema:
             schema = schema.copy()
-            ref = schema.pop('$ref')
+            ref = schema.pop(_REF)
             cls = self.load(scope(ref, id))
             if schema:
                 cls = cls.extend_type(id, **schema)
@@ -105,21 +134,51 @@ class TypeBuilder(GenericClassRegistry):
             self._registry[id] = self.build(id)
         return self._registry[id]
 
+    def meta_validator(self, ms_uri):
+        """Return the validator of a metaschema, created once per metaschema uri."""
+        validator = self._meta_validators.get(ms_uri)
+        if validator is None:
+            metaschema = resolve_uri(ms_uri)
+            resolver = UriResolver.create(uri=ms_uri, schema=metaschema)
+            validator = self._meta_validators[ms_uri] = DefaultValidator(metaschema, resolver=resolver)
+        return validator
+
     def check_schema(self, schema):
         from jsonschema.exceptions import SchemaError
-        for error in default_meta_validator.iter_errors(schema):
+        error = first_error(default_meta_validator, schema)
+        if error is not None:
             raise SchemaError.create_from(error)
 
+    def validator(self, schema):
+        """Check a schema and return its validator, created once per json-serializable schema."""
+        try:
+            key = json.dumps(schema, sort_keys=True)
+        except (TypeError, ValueError):
+            key = None
+        validator = self._validators.get(key) if key is not None else None
+        if validator is None:
+            self.check_schema(schema)
+            validator = DefaultValidator(schema)
+            if key is not None:
+                if len(self._validators) >= 1024:
+                    self._validators.clear()
+                self._validators[key] = validator
+        return validator
+
+    @staticmethod
     def schema_mro(id, schema=None):
         schema = schema or resolve_uri(id)
+        mro = OrderedDict()
         def _schema_mro(id, sch):
             for e in sch.get('extends', []):
                 i = scope(e, id)
-                s = resolve_uri(i)
-                yield i, s
-                for m in _schema_mro(i, s):
-                    yield m
-        return OrderedDict(_schema_mro(id, schema))
+                if i in mro:
+                    # already walked through another branch
+                    continue
+                mro[i] = s = resolve_uri(i)
+                _schema_mro(i, s)
+        _schema_mro(id, schema)
+        return mro
 
     def expand(self, id, schema=None):
         def scope_refs(id, schema):
@@ -130,7 +189,7 @@ class TypeBuilder(GenericClassRegistry):
                         v['$ref'] = scope(v['$ref'], id)
             apply_through_collection(schema, _scope_refs)
 
-        schema = copy.deepcopy(schema or resolve_uri(id))
+        schema = copy_schema(schema or resolve_uri(id))
         mro = self.schema_mro(id, schema)
         scope_refs(id, schema)
         for i, s in mro.items():
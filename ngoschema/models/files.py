@@ -13,13 +13,13 @@ import codecs
 import os
 
 import arrow
-import six
 import itertools
 
 from future.utils import with_metaclass
 from ngofile.list_files import list_files
-from six.moves.urllib.request import urlopen
-from collections import Mapping, ChainMap
+from urllib.request import urlopen
+from collections import ChainMap
+from collections.abc import Mapping
 
 #from ngoschema import utils, get_builder
 #from ..protocol_base import ProtocolBase
@@ -248,7 +248,7 @@ class DocumentRegistry(Mapping):
         return self._chained[key]
 
     def __iter__(self):
-        return six.iterkeys(self._chained)
+        return iter(self._chained)
 
     def __len__(self):
         return len(self._chained)
@@ -10,7 +10,7 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 from future.utils import with_metaclass
-from collections import Mapping
+from collections.abc import Mapping
 
 from .. import settings
 from ..decorators import memoized_property, depend_on_prop
@@ -63,7 +63,7 @@ class Entity(with_metaclass(SchemaMetaclass, EntityContext)):
             session = context._session if context else None
             session = session or cls._session
             inst = session.resolve_fkey(args, cls)
-            cls = inst.__class__
+            return ObjectProtocol.__new__(inst.__class__, *args, **kwargs)
         return ObjectProtocol.__new__(cls, *args, **kwargs)
 
     def __init__(self, value=None, primaryKeys=None, **opts):
@@ -2,8 +2,7 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
-from collections import MutableSequence
-import six
+from collections.abc import MutableSequence
 import logging
 
 from ..types.array import Array, ArraySerializer, ArrayDeserializer
@@ -44,6 +43,7 @@ class ArrayProtocol(CollectionProtocol, Array, MutableSequence):
         CollectionProtocol._touch(self)
         self._dataValidated = [None] * len(self._data)
         self._itemsInputs = [{}] * len(self._data)
+        self._itemsStatic = set()
 
     #@staticmethod
     #def _items_type(self, item):
@@ -73,6 +73,7 @@ class ArrayProtocol(CollectionProtocol, Array, MutableSequence):
         return len(self._data)
 
     def insert(self, item, value):
+        CollectionProtocol._touch(self)
         self._itemsInputs.insert(item, {})
         self._dataValidated.insert(item, None)
         self._data.insert(item, value)
@@ -85,10 +86,10 @@ class ArrayProtocol(CollectionProtocol, Array, MutableSequence):
 
     def _str_list(self):
         if self._str is None:
-            hidden = max(0, len(self) - settings.PPRINT_MAX_EL)
+            m = settings.PPRINT_MAX_EL
+            hidden = max(0, len(self) - m)
             a = [shorten(self._dataValidated[i] or self._data[i], str_fun=repr)
-                 for i, t in enumerate(self._items_types(self, self._data))
-                 if i < settings.PPRINT_MAX_EL] + (['+%i...' % hidden] if hidden else [])
+                 for i in range(min(len(self), m))] + (['+%i...' % hidden] if hidden else [])
             self._str = '[%s]' % (', '.join(a))
         return self._str
 
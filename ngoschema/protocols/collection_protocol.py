@@ -20,6 +20,28 @@ from .type_protocol import TypeProtocol
 
 LAZY_LOADING = settings.DEFAULT_COLLECTION_LAZY_LOADING
 
+# evaluation kinds of item types
+EVAL_PRIMITIVE, EVAL_ANY, EVAL_CLASS, EVAL_TYPE = range(4)
+
+
+def evaluation_kind(t):
+    """Return how items of type t are evaluated and if t is lazy loading.
+    Resolved once and stored in the type own dictionary (not inherited by subclasses)."""
+    kind = t.__dict__.get('_evaluationKind')
+    if kind is None:
+        from ..types.constants import _True
+        if t.is_primitive():
+            k = EVAL_PRIMITIVE
+        elif isinstance(t, _True):
+            k = EVAL_ANY
+        elif isinstance(t, type):
+            k = EVAL_CLASS
+        else:
+            k = EVAL_TYPE
+        kind = (k, getattr(t, '_lazyLoading', False))
+        setattr(t, '_evaluationKind', kind)
+    return kind
+
 
 class CollectionProtocol(Collection):
     _lazyLoading = LAZY_LOADING
@@ -29,9 +51,11 @@ class CollectionProtocol(Collection):
     _data = None
     _dataValidated = None
     _itemsInputs = None
+    _itemsStatic = None
     _items_type_cache = None
     _repr = None
     _str = None
+    _isValidated = False
     #_session = None
 
     def __init__(self, value=None, lazyLoading=None, items=None, validate=True, context=None, session=None, **opts):
@@ -48,7 +72,7 @@ class CollectionProtocol(Collection):
         ctx = self._create_context(self, context=context)
         self.set_context(ctx, session=session, **opts)
         if not lz:
-            self._collType(self)
+            self._load_items()
         if validate:
             self._validate(self, self, items=False, context=ctx)
 
@@ -82,17 +106,19 @@ class CollectionProtocol(Collection):
 
     @staticmethod
     def _serialize(self, value, excludes=[], **opts):
-        excludes = list(self._notSerialized.union(excludes))
+        excludes = self._notSerialized.union(excludes)
         return self._collection._serialize(self, value, excludes=excludes, **opts)
 
     def _touch(self):
         self._repr = None
         self._str = None
+        self._isValidated = False
 
     def _items_touch(self, item):
         CollectionProtocol._touch(self)
         self._dataValidated[item] = None
         self._itemsInputs[item] = {}
+        self._itemsStatic.discard(item)
         for d, s in self._dependencies.items():
             if item in s:
                 self._items_touch(d)
@@ -116,21 +142,20 @@ class CollectionProtocol(Collection):
         return ret
 
     def _items_evaluate(self, item, **opts):
-        from ..types.constants import _True
         v = self._data[item]
         t = self._items_type(self, item)
+        kind, lazy = evaluation_kind(t)
         opts.setdefault('context', self._context)
-        if hasattr(t, '_lazyLoading'):
-            if t._lazyLoading:
-                opts.setdefault('validate', False)
+        if lazy:
+            opts.setdefault('validate', False)
         try:
-            if t.is_primitive():
+            if kind == EVAL_PRIMITIVE:
                 opts['serialize'] = False
                 return t(v, **opts)
-            elif isinstance(t, _True):
+            elif kind == EVAL_ANY:
                 return v
             else:
-                return v if isinstance(t, type) and isinstance(v, t) else t(v, **opts)
+                return v if kind == EVAL_CLASS and isinstance(v, t) else t(v, **opts)
         except Exception as er:
             self._logger.error(er, exc_info=True)
             raise er
@@ -141,19 +166,27 @@ class CollectionProtocol(Collection):
         opts['context'] = getattr(v, '_context', self._context)
         return t._serialize(t, v, **opts)
 
+    def _load_items(self):
+        """Evaluate all items (when not lazy loading)."""
+        self._collType(self)
+
     def __setitem__(self, item, value):
+        CollectionProtocol._touch(self)
         self._data[item] = value
         if not self._lazyLoading:
             self._itemsInputs[item] = self._items_inputs_evaluate(item)
             self._set_dataValidated(item, self._items_evaluate(item))
 
     def __getitem__(self, item):
-        if self._dataValidated[item] is None:
+        v = self._dataValidated[item]
+        if v is None:
             self._itemsInputs[item] = self._items_inputs_evaluate(item)
             self._set_dataValidated(item, self._items_evaluate(item))
-        return self._dataValidated[item]
+            v = self._dataValidated[item]
+        return v
 
     def __delitem__(self, index):
+        CollectionProtocol._touch(self)
         del self._data[index]
         del self._dataValidated[index]
         del self._itemsInputs[index]
@@ -170,7 +203,7 @@ class CollectionProtocol(Collection):
         t = self._items_type(self, item)
         orig = self._data[item]
         # to avoid comparison of objects (often equality which is the longest to validate), only touch for changed primitives
-        if t.is_primitive():
+        if evaluation_kind(t)[0] == EVAL_PRIMITIVE:
             if value != orig:
                 self._items_touch(item)
         else:
@@ -179,24 +212,42 @@ class CollectionProtocol(Collection):
 
     def _set_dataValidated(self, item, value):
         t = self._items_type(self, item)
-        if t.is_primitive():
-            orig = self._data[item]
+        data = self._data
+        if evaluation_kind(t)[0] == EVAL_PRIMITIVE:
+            orig = data[item]
             if not Pattern.check(orig) and not Expr.check(orig):
-                self._data[item] = value
+                data[item] = value
         else:
-            self._data[item] = value
+            data[item] = value
         self._dataValidated[item] = value
 
     def _is_outdated(self, item):
-        return (self._dataValidated[item] is None and self._data[item] is not None
-                ) or (self._itemsInputs.get(item, {}) != self._items_inputs_evaluate(item))
+        if self._dataValidated[item] is None and self._data[item] is not None:
+            return True
+        # items without dependencies nor inputs can only be outdated by a touch
+        if item in self._itemsStatic:
+            return False
+        inputs = self._items_inputs_evaluate(item)
+        recorded = self._itemsInputs.get(item, {})
+        if not inputs and not recorded and not self._dependencies.get(item):
+            self._itemsStatic.add(item)
+        return recorded != inputs
 
     @classmethod
     def create(cls, value=None, **opts):
         return cls(value, **opts)
 
-    def do_validate(self, **opts):
-        return self._validate(self, self, **opts)
+    def do_validate(self, force=False, **opts):
+        # skip validation if nothing was touched since the last plain validation
+        if self._isValidated and not force and not opts:
+            return self
+        value = self._validate(self, self, **opts)
+        if not opts:
+            # nested collections can be modified without touching their parent
+            data = self._dataValidated
+            items = data.values() if isinstance(data, dict) else data
+            self._isValidated = not any(isinstance(v, CollectionProtocol) for v in items)
+        return value
 
     def do_serialize(self, deserialize=False, **opts):
         opts['context'] = self._context
@@ -3,7 +3,6 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 import collections
 
-import six
 import os
 import codecs
 import logging
@@ -3,22 +3,24 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import sys
-import six
 import logging
-from collections import MutableMapping, Mapping
+from collections.abc import MutableMapping, Mapping, Sequence
 from collections import OrderedDict, defaultdict
 import re
 from operator import neg
 import copy
+from types import FunctionType
 
 from ..exceptions import InvalidValue
 from ..utils import ReadOnlyChainMap as ChainMap, shorten
 from .. import decorators
-from ..resolvers.uri_resolver import UriResolver, resolve_uri
+from ..resolvers.uri_resolver import UriResolver
 from ..types.array import Array
 from ..types.type import Primitive
-from ..types.object import Object, ObjectSerializer, ObjectDeserializer
-from ..types.symbols import Function
+from ..types.object import Object, ObjectSerializer, ObjectDeserializer, _IMMUTABLE_DEFAULTS
+from ..types.strings import String, Pattern, Expr
+from ..types.numerics import Integer, Number
+from ..types.boolean import Boolean
 from ..types.uri import Id, scope
 from ..managers.type_builder import DefaultValidator
 from ..managers.namespace_manager import default_ns_manager, clean_js_name
@@ -28,6 +30,43 @@ from .serializer import Serializer
 from .type_protocol import TypeProtocol
 from .collection_protocol import CollectionProtocol
 
+_object_getattribute = object.__getattribute__
+
+# registered types converting their values regardless of the evaluation context
+_CONTEXT_FREE_TYPES = (String, Integer, Number, Boolean)
+_context_free_cache = {}
+
+
+def _context_free(t):
+    """Return True if type t is based on a context free registered type (not Id, Uri, Path...)."""
+    from ..managers.type_builder import type_builder
+    cls = t if isinstance(t, type) else type(t)
+    ret = _context_free_cache.get(cls)
+    if ret is None:
+        registered = set(type_builder._type_registry.values())
+        base = next((c for c in cls.__mro__ if c in registered), None)
+        ret = _context_free_cache[cls] = base in _CONTEXT_FREE_TYPES
+    return ret
+
+# inspections and decorated methods are shared by all the classes defining (or importing) a function,
+# they are stored in the function __dict__ to be freed with the function (a global mapping keyed by
+# function would keep it alive, as decorated functions reference the function they wrap)
+_FUNCTION_CACHE_ATTR = '_ngoschemaCache'
+_inspect_function = None
+
+
+def _function_cache(fn):
+    """Return the cache dictionary stored in a function, None if it has no __dict__."""
+    try:
+        d = fn.__dict__
+    except AttributeError:
+        return None
+    owner, cache = d.get(_FUNCTION_CACHE_ATTR, (None, None))
+    # __dict__ is copied by functools.wraps (and shared by proxies): check the cache belongs to this function
+    if owner is not fn:
+        owner, cache = d[_FUNCTION_CACHE_ATTR] = (fn, {})
+    return cache
+
 ATTRIBUTE_NAME_FIELD = settings.ATTRIBUTE_NAME_FIELD
 ADD_LOGGING = settings.DEFAULT_ADD_LOGGING
 ASSERT_ARGS = settings.DEFAULT_ASSERT_ARGS
@@ -41,6 +80,55 @@ PROP_PREF = {
 }
 
 
+def inspect_function(fn):
+    """Inspect a function with ngoinsp (if available), caching the result by function."""
+    global _inspect_function
+    cache = _function_cache(fn)
+    if cache is not None and 'inspection' in cache:
+        return cache['inspection']
+    if _inspect_function is None:
+        try:
+            from ngoinsp.inspectors.inspect_symbols import inspect_function as _inspect_function
+        except Exception as er:
+            logging.warning(er)
+            _inspect_function = lambda x: {'arguments': []}
+    fi = _inspect_function(fn)
+    if cache is not None:
+        cache['inspection'] = fi
+    return fi
+
+
+def decorate_method(logger, clsname, name, fn, add_logging, assert_args):
+    """Decorate a method with init logging, argument validation and exception logging."""
+    key = (name, add_logging, assert_args)
+    cache = _function_cache(fn)
+    if cache is not None and key in cache:
+        return cache[key]
+    f = fn
+    if add_logging:
+        if name == '__init__':
+            f = decorators.log_init(f)
+    if assert_args and f.__doc__:
+        from ..types import Type
+        fi = inspect_function(f)
+        if 'assert_arg' in [d['name'] for d in fi.get('decorators', [])]:
+            # function is already using assert_arg
+            return fn
+        for pos, a in enumerate(fi['arguments']):
+            t = a.get('type', False)
+            if t:
+                # only assert args which are defined
+                logger.debug("decorate <%s>.%s with argument %i validity check.", clsname, name, pos)
+                f = decorators.assert_arg(pos, Type, **a)(f)
+    # add exception logging
+    if add_logging and not name.startswith("__"):
+        logger.debug("decorate <%s>.%s with exception logger", clsname, name)
+        f = decorators.log_exceptions(f)
+    if cache is not None:
+        cache[key] = f
+    return f
+
+
 def split_cname(cname):
     # split cname into an array of identifiers
     # in case a relative cname is given, removes the first empty cname
@@ -53,6 +141,66 @@ def split_cname(cname):
     return cns.pop(0) if cns and not cns[0] else cns
 
 
+_SETTER_TEMPLATE = """
+def setter(obj, value):
+    try:
+        if {pname!r} in obj._readOnly:
+            raise AttributeError("'%s' is read only" % {pname!r}){unchanged_check}
+        obj._set_data({pname!r}, value)
+        if not obj._lazyLoading:
+            obj._itemsInputs[{pname!r}] = obj._items_inputs_evaluate({pname!r})
+            iopts = {{'validate': False}} if {pname!r} in obj._notValidated else {{}}
+            obj._set_dataValidated({pname!r}, obj._items_evaluate({pname!r}, **iopts)){fset_call}
+    except Exception as er:
+        obj._logger.error(er, exc_info=True)
+        raise
+"""
+
+_UNCHANGED_CHECK_TEMPLATE = """
+        # reassigning the current clean value (immutable or validated since last touch) is a no-op
+        if value is not None and value is obj._dataValidated.get({pname!r}) and value is obj._data.get({pname!r}) \\
+                and (isinstance(value, immutables) or getattr(value, '_isValidated', False)):
+            return"""
+
+_FSET_CALL_TEMPLATE = """
+            fset(obj, obj._dataValidated[{pname!r}])"""
+
+
+def compile_setter(pname, fset=None):
+    """Generate the setter of a property with its name and its optional user setter baked in the code."""
+    fset_call = _FSET_CALL_TEMPLATE.format(pname=pname) if fset else ''
+    # a user setter might have side effects, it is always called
+    unchanged_check = _UNCHANGED_CHECK_TEMPLATE.format(pname=pname) if not fset else ''
+    namespace = {'fset': fset, 'immutables': _IMMUTABLE_DEFAULTS}
+    exec(_SETTER_TEMPLATE.format(pname=pname, fset_call=fset_call, unchanged_check=unchanged_check), namespace)
+    return namespace['setter']
+
+
+_LOADER_TEMPLATE = """
+def load_items(obj):
+    data = obj._dataValidated{get_calls}
+    for k in [k for k in data if k not in known]:
+        if obj._lazyLoading or obj._is_outdated(k):
+            obj._itemsInputs[k] = obj._items_inputs_evaluate(k)
+            obj._set_dataValidated(k, obj._items_evaluate(k))
+"""
+
+_GET_CALL_TEMPLATE = """
+    if {pname!r} in data:
+        get_{i}(obj)"""
+
+
+def compile_loader(descriptors):
+    """Generate the eager loader of a class, with a direct call to each descriptor getter unrolled in the code."""
+    namespace = {'known': frozenset(descriptors)}
+    get_calls = []
+    for i, (pname, desc) in enumerate(descriptors.items()):
+        namespace[f'get_{i}'] = desc.__get__
+        get_calls.append(_GET_CALL_TEMPLATE.format(pname=pname, i=i))
+    exec(_LOADER_TEMPLATE.format(get_calls=''.join(get_calls)), namespace)
+    return namespace['load_items']
+
+
 class PropertyDescriptor:
 
     def __init__(self, pname, ptype, fget=None, fset=None, fdel=None, desc=None):
@@ -62,28 +210,29 @@ class PropertyDescriptor:
         self.fget = fget
         self.fset = fset
         self.fdel = fdel
+        self._setter = compile_setter(pname, fset)
 
     def __get__(self, obj, owner=None):
         if obj is None and owner is not None:
             return self
         try:
-            key = self.pname
+            key, fget, fset = self.pname, self.fget, self.fset
+            validated = obj._dataValidated
             outdated = obj._is_outdated(key)
-            if self.fget and obj._dataValidated.get(key) is None:
+            if fget and validated.get(key) is None:
                 outdated = True
             #if outdated or self.fget: # or self.fset:
             if outdated:
                 inputs = obj._items_inputs_evaluate(key)
-                if self.fget:
-                    obj._set_data(key, self.fget(obj))
+                if fget:
+                    obj._set_data(key, fget(obj))
                 iopts = {'validate': False} if key in obj._notValidated else {}
                 obj._set_dataValidated(key, obj._items_evaluate(key, **iopts))
                 obj._itemsInputs[key] = inputs  # after set_validated_data as it touches inputs data
-            value = obj._dataValidated[key]
-            if outdated and self.fset:
-                self.fset(obj, value)
+                if fset:
+                    fset(obj, validated[key])
             # value can change in setter
-            return obj._dataValidated[key]
+            return validated[key]
         except Exception as er:
             obj._logger.error(er, exc_info=True)
             raise
@@ -91,22 +240,7 @@ class PropertyDescriptor:
             #raise six.reraise(AttributeError, value, trace)
 
     def __set__(self, obj, value):
-        try:
-            key = self.pname
-            if key in obj._readOnly:
-                raise AttributeError("'%s' is read only" % key)
-            obj._set_data(key, value)
-            if not obj._lazyLoading:
-                obj._itemsInputs[key] = obj._items_inputs_evaluate(key)
-                iopts = {'validate': False} if key in obj._notValidated else {}
-                obj._set_dataValidated(key, obj._items_evaluate(key, **iopts))
-                if self.fset:
-                    self.fset(obj, obj._dataValidated[key])
-        except Exception as er:
-            obj._logger.error(er, exc_info=True)
-            raise
-            #etype, value, trace = sys.exc_info()
-            #raise six.reraise(AttributeError, value, trace)
+        self._setter(obj, value)
 
     def __delete__(self, obj):
         key = self.pname
@@ -114,6 +248,7 @@ class PropertyDescriptor:
             raise AttributeError('%s is a required argument.' % key)
         if self.fdel:
             self.fdel(obj)
+        CollectionProtocol._touch(obj)
         del obj._data[key]
         del obj._dataValidated[key]
         del obj._itemsInputs[key]
@@ -150,6 +285,8 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
     _abstract = False
     _propertiesAllowed = set()
     _propertiesTranslation = {}
+    _propertiesTranslationInv = {}
+    _propertiesRenamed = {}
     _relationships = {}
     _aliases = {}
     _aliasesNegated = {}
@@ -160,8 +297,7 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
         if isinstance(data, Mapping) and data.get('$schema'):
             s_id = Id.convert(scope(data.pop('$schema'), cls._id), **kwargs)
             if s_id != cls._id:
-                cls = type_builder.load(s_id)
-                return cls(*args, **kwargs)
+                return type_builder.load(s_id)(*args, **kwargs)
         return super(ObjectProtocol, cls).__new__(cls)
 
     @staticmethod
@@ -169,10 +305,9 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
         if not isinstance(value, Mapping):
             raise TypeError('%s if not of type mapping.' % value)
         value = self._collType(value)
-        keys = set(value)
-        for k1, k2 in ChainMap(self._propertiesTranslation, self._aliases, self._aliasesNegated).items():
-            if k1 in keys:
-                value[k2] = value.pop(k1)
+        renamed = self._propertiesRenamed
+        for k in [k for k in value if k in renamed]:
+            value[renamed[k]] = value.pop(k)
         for k in self._notValidated:
             value.pop(k, None)
         return CollectionProtocol._check(self, value, **opts)
@@ -214,7 +349,7 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
             if s_id != self._id:
                 self = type_builder.load(s_id)
         # handle aliases/property translations
-        for k in set(value).difference(self._properties).intersection(self._propertiesTranslation):
+        for k in [k for k in value if k in self._propertiesTranslation and k not in self._properties]:
             # deals with conflicting properties with identical translated names
             value[self._propertiesTranslation[k]] = value.pop(k)
         value.update({k2: value.pop(k1) for k1, k2 in self._aliases.items() if k1 in value})
@@ -242,13 +377,29 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
             if item in s:
                 self._items_touch(d)
 
+    _items_default_evaluated_cache = {}
+    def _items_evaluate(self, item, **opts):
+        # constant literal defaults of context free types are evaluated once per class,
+        # the cache is keyed by the raw default object
+        cache = self._items_default_evaluated_cache
+        v = self._data[item]
+        cached = cache.get(item)
+        if cached is not None and cached[0] is v:
+            return cached[1]
+        ret = CollectionProtocol._items_evaluate(self, item, **opts)
+        if v is not None and v is self._items_default_cache.get(item) and isinstance(ret, _IMMUTABLE_DEFAULTS) \
+                and opts.get('validate', True) and not Pattern.check(v) and not Expr.check(v) \
+                and _context_free(self._items_type(self, item)):
+            cache[item] = (v, ret)
+        return ret
+
     def _touch(self):
         CollectionProtocol._touch(self)
-        keys = list(self._data.keys())
-        self._itemsInputs = {k: {} for k in keys}
-        self._dataValidated = {k: None for k in keys}
-        self._dataAdditional = {k: None for k in self._dataAdditional.keys()}
-        self._dependencies = dict(self.__class__._dependencies)
+        # inputs are replaced, never updated in place: they can share the same empty dict
+        self._itemsInputs = dict.fromkeys(self._data, {})
+        self._itemsStatic = set()
+        self._dataValidated = dict.fromkeys(self._data)
+        self._dataAdditional = dict.fromkeys(self._dataAdditional)
 
     def __len__(self):
         return len(self._dataValidated)
@@ -256,51 +407,102 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
     def __iter__(self):
         return iter(self._dataValidated.keys())
 
-    __properties_raw_trans = None
+    def _load_items(self):
+        # keys are already resolved: call descriptors directly rather than through __getitem__
+        rels = self._relationshipsDescriptor
+        props = self._propertiesDescriptor
+        for k in list(self._dataValidated):
+            desc = rels.get(k) or props.get(k)
+            if desc:
+                desc.__get__(self)
+            elif self._lazyLoading or self._is_outdated(k):
+                self._itemsInputs[k] = self._items_inputs_evaluate(k)
+                self._set_dataValidated(k, self._items_evaluate(k))
+
+    def __eq__(self, other):
+        # compare items by key, without type checking nor serializing other
+        if other is self:
+            return True
+        if not isinstance(other, Mapping) or len(self) != len(other):
+            return False
+        for k, v in other.items():
+            if k not in self._dataValidated or self[k] != v:
+                return False
+        return True
+
+    __hash__ = CollectionProtocol.__hash__
+
+    _propertiesRaw = {}
+    _propertiesTrans = {}
     @classmethod
     def _properties_raw_trans(cls, name):
-        if cls.__properties_raw_trans is None:
-            cls.__properties_raw_trans = {}
-        cached = cls.__properties_raw_trans.get(name)
-        if cached:
-            return cached
+        # caches are created for each class in build, so that subclasses do not share them
+        raw = cls._propertiesRaw.get(name)
+        if raw is not None:
+            return raw, cls._propertiesTrans[name]
         if name in cls._properties:
-            cls.__properties_raw_trans[name] = (name, name)
-            return name, name
-        for trans, raw in cls._propertiesTranslation.items():
-            if name in (raw, trans):
-                cls.__properties_raw_trans[name] = (raw, trans)
-                return raw, trans
-        alias = cls._aliases.get(name)
-        if alias:
-            cls.__properties_raw_trans[name] = (alias, name)
-            return alias, name
-        alias = cls._aliasesNegated.get(name)
-        if alias:
-            cls.__properties_raw_trans[name] = (alias, name)
-            return alias, name
-        if cls._propertiesAdditional:
-            trans = clean_js_name(name)
-            cls.__properties_raw_trans[name] = (name, trans)
-            return name, trans
-        #cls.__properties_raw_trans[name] = (None, None)
-        return None, None
+            raw, trans = name, name
+        elif name in cls._propertiesTranslation:
+            raw, trans = cls._propertiesTranslation[name], name
+        elif name in cls._propertiesTranslationInv:
+            raw, trans = name, cls._propertiesTranslationInv[name]
+        elif cls._aliases.get(name):
+            raw, trans = cls._aliases[name], name
+        elif cls._aliasesNegated.get(name):
+            raw, trans = cls._aliasesNegated[name], name
+        elif cls._propertiesAdditional:
+            raw, trans = name, clean_js_name(name)
+        else:
+            return None, None
+        cls._propertiesRaw[name] = raw
+        cls._propertiesTrans[name] = trans
+        return raw, trans
+
+    @classmethod
+    def _properties_raw(cls, name):
+        raw = cls._propertiesRaw.get(name)
+        return raw if raw is not None else cls._properties_raw_trans(name)[0]
+
+    _attributesResolved = {}
+    @classmethod
+    def _resolve_attribute(cls, name):
+        """Resolve an attribute name through negated aliases, aliases and translations,
+        returning a tuple (negated, name, raw, descriptor) memoized by class."""
+        cached = cls._attributesResolved.get(name)
+        if cached is None:
+            negated = name in cls._aliasesNegated
+            name_ = cls._aliasesNegated.get(name, name)
+            name_ = cls._aliases.get(name_, name_)
+            raw = cls._propertiesTranslation.get(name_, name_)
+            desc = cls._propertiesDescriptor.get(raw) or cls._relationshipsDescriptor.get(raw)
+            cls._attributesResolved[name] = cached = (negated, name_, raw, desc)
+        return cached
+
+    _attributesSetters = {}
+    @classmethod
+    def _resolve_setter(cls, name):
+        """Resolve the generated setter of an attribute name, with alias negation folded in,
+        memoized by class (False if the name is not a declared property or relationship)."""
+        negated, name_, raw, desc = cls._resolve_attribute(name)
+        setter = False
+        if desc:
+            # relationship descriptors have no generated setter
+            setter = desc._setter if isinstance(desc, PropertyDescriptor) else desc.__set__
+            if negated:
+                setter = lambda obj, value, _set=setter: _set(obj, neg(value))
+        cls._attributesSetters[name] = setter
+        return setter
 
     def __getattr__(self, name):
         # private and protected attributes at accessed directly
-        if name.startswith('_') or name in self._attributesOrig:
-            if name.startswith('__'):
-                return MutableMapping.__getattribute__(self, name)
-            if name not in self._propertiesAllowed:
-                return MutableMapping.__getattribute__(self, name)
-                return self.__dict__[name]
-        op = lambda x: neg(x) if name in self._aliasesNegated else x
-        name = self._aliasesNegated.get(name, name)
-        name = self._aliases.get(name, name)
-        raw = self._propertiesTranslation.get(name, name)
-        desc = self._propertiesDescriptor.get(raw) or self._relationshipsDescriptor.get(raw)
+        if name[:1] == '_' or name in self._attributesOrig:
+            if name[:2] == '__' or name not in self._propertiesAllowed:
+                return _object_getattribute(self, name)
+        negated, name, raw, desc = self._resolve_attribute(name)
         if desc:
-            return op(desc.__get__(self))
+            v = desc.__get__(self)
+            return neg(v) if negated else v
+        op = neg if negated else lambda x: x
         if self._propertiesAdditional and name in self._data:
             self._itemsInputs[raw] = self._items_inputs_evaluate(name)
             self._dataAdditional[raw] = v = op(self[name])
@@ -327,16 +529,18 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
             # empty path, yield current path and doc
             if not cn:
                 yield cur, cn, cur_path
-            if Object.check(cur):
+            # plain isinstance tests (equivalent to Object.check and Array.check without
+            # string splitting) as they are done for each node of the tree
+            if isinstance(cur, Mapping):
                 cn2 = cur_cn + [(cur.get(ATTRIBUTE_NAME_FIELD) or '<anonymous>').rsplit(':')[-1]]
                 if cn2 == cn[0:len(cn2)]:
                     if cn2 == cn:
                         yield cur, cn, cur_path
                     for k, v in cur.items():
-                        if Object.check(v) or Array.check(v, split_string=False):
+                        if isinstance(v, (Mapping, Sequence)) and not isinstance(v, str):
                             for _ in _resolve_cname_path(cn, v, cn2, cur_path + [k]):
                                 yield _
-            if Array.check(cur, split_string=False):
+            if isinstance(cur, Sequence) and not isinstance(cur, str):
                 for i, v in enumerate(cur):
                     for _ in _resolve_cname_path(cn, v, cur_cn, cur_path + [i]):
                         yield _
@@ -367,10 +571,15 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
 
     def __setattr__(self, name, value):
         # private and protected attributes at accessed directly
-        if name.startswith('_'):  # or name in self._attributesOrig:
+        if name[:1] == '_':  # or name in self._attributesOrig:
             if name not in self._propertiesAllowed:
                 self.__dict__[name] = value
                 return
+        setter = self._attributesSetters.get(name)
+        if setter is None:
+            setter = self._resolve_setter(name)
+        if setter:
+            return setter(self, value)
         try:
             self[name] = value
         except KeyError as er:
@@ -396,22 +605,24 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
         desc = self._relationshipsDescriptor.get(key)
         if desc:
             return desc.__get__(self)
-        op = lambda x: neg(x) if key in self._aliasesNegated else x
-        key = self._aliasesNegated.get(key, key)
+        aliases_negated = self._aliasesNegated
+        negated = key in aliases_negated
+        key = aliases_negated.get(key, key)
         key = self._aliases.get(key, key)
-        raw, trans = self._properties_raw_trans(key)
+        raw = self._properties_raw(key)
         if raw not in self._data:
             raise KeyError(key)
         desc = self._propertiesDescriptor.get(raw)
         if desc:
-            return op(desc.__get__(self))
-        if self._lazyLoading or self._is_outdated(key):
-            self._itemsInputs[key] = self._items_inputs_evaluate(key)
-            self._set_dataValidated(key, self._items_evaluate(key))
-        return op(self._dataValidated[key])
+            v = desc.__get__(self)
+        else:
+            if self._lazyLoading or self._is_outdated(key):
+                self._itemsInputs[key] = self._items_inputs_evaluate(key)
+                self._set_dataValidated(key, self._items_evaluate(key))
+            v = self._dataValidated[key]
+        return neg(v) if negated else v
 
     def __setitem__(self, key, value):
-        op = lambda x: neg(x) if key in self._aliasesNegated else x
         if '.' in key:
             parts = split_cname(key) # case: canonical name such as a[0][1].b[0].c
             cur = self
@@ -424,47 +635,62 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
                 return
             except Exception as er:
                 raise KeyError(key)
-        raw, trans = self._properties_raw_trans(key)
-        desc = self._propertiesDescriptor.get(raw) or self._relationshipsDescriptor.get(raw)
+        if key in self._aliasesNegated:
+            value = neg(value)
+        raw = self._properties_raw(key)
+        desc = self._propertiesDescriptor.get(raw)
         if desc:
-            return desc.__set__(self, op(value))
+            return desc._setter(self, value)
+        desc = self._relationshipsDescriptor.get(raw)
+        if desc:
+            return desc.__set__(self, value)
         if not self._propertiesAdditional:
             raise KeyError(key)
-        v = op(value)
-        self._data[key] = self._dataAdditional[key] = self._dataValidated[key] = v
+        self._data[key] = self._dataAdditional[key] = self._dataValidated[key] = value
+        self._itemsStatic.discard(key)
+        CollectionProtocol._touch(self)
 
     def __delitem__(self, key):
-        for trans, raw in self._propertiesTranslation.items():
-            if key in (trans, raw):
-                delattr(self, trans)
-                break
+        trans = key if key in self._propertiesTranslation else self._propertiesTranslationInv.get(key)
+        if trans is not None:
+            delattr(self, trans)
         else:
+            CollectionProtocol._touch(self)
             del self._data[key]
             del self._itemsInputs[key]
             del self._dataValidated[key]
 
+    _aliasesPlan = None
+    @staticmethod
+    def _aliases_plan(self):
+        """Return the serialization plan of aliases as a list of tuples (alias, raw, negated, primitive),
+        resolved once per class."""
+        cls = self if isinstance(self, type) else self.__class__
+        plan = cls.__dict__.get('_aliasesPlan')
+        if plan is None:
+            plan = [(alias, raw, False, self._items_type(self, raw).is_primitive())
+                    for alias, raw in self._aliases.items()]
+            plan += [(alias, raw, True, self._items_type(self, raw).is_primitive())
+                     for alias, raw in self._aliasesNegated.items()]
+            cls._aliasesPlan = plan
+        return plan
+
     @staticmethod
     def _serialize(self, value, schema=False, excludes=[], only=[], **opts):
         serializer = self if not isinstance(value, Serializer) else value.__class__
         context = getattr(value, '_context', self._context)
         attr_prefix = opts.get('attr_prefix', self._attrPrefix)
         ret = CollectionProtocol._serialize(serializer, value, excludes=excludes, only=only, **opts)
-        ret = self._collType([((attr_prefix if self._items_type(serializer, k).is_primitive() else '') + k, ret[k])
-                                for k in ret.keys()])
-        for alias, raw in self._aliases.items():
-            if only and alias not in only:
-                continue
-            if alias not in excludes:
-                v = ret.get(raw)
-                if v is not None:
-                    ret[(attr_prefix if self._items_type(self, raw).is_primitive() else '') + alias] = v
-        for alias, raw in self._aliasesNegated.items():
+        if attr_prefix:
+            ret = self._collType([((attr_prefix if self._items_type(serializer, k).is_primitive() else '') + k, ret[k])
+                                  for k in ret.keys()])
+        for alias, raw, negated, primitive in self._aliases_plan(self):
             if only and alias not in only:
                 continue
             if alias not in excludes:
                 v = ret.get(raw)
                 if v is not None:
-                    ret[(attr_prefix if self._items_type(self, raw).is_primitive() else '') + alias] = - v
+                    ret[(attr_prefix if primitive else '') + alias] = - v if negated else v
         if isinstance(value, ObjectProtocol) and value._id != self._id:
             schema = True
         if schema:
@@ -515,11 +741,6 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
         from ..managers.type_builder import type_builder, scope
         from ..managers.relationship_builder import RelationshipDescriptor, RelationshipBuilder, relationship_builder
         from ..protocols import TypeProxy
-        try:
-            from ngoinsp.inspectors.inspect_symbols import inspect_function
-        except Exception as er:
-            logging.warning(er)
-            inspect_function = lambda x: {'arguments': []}
         attrs = attrs or {}
         cname = default_ns_manager.get_id_cname(id)
         clsname = attrs.pop('_clsname', None) or cname.split('.')[-1]
@@ -528,16 +749,12 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
         logger = logging.getLogger(cname)
         level = logging.getLevelName(attrs.get('_logLevel', LOGGER_LEVEL))
         logger.setLevel(level)
-        attributes_orig = set([k for k in attrs.keys() if not k.startswith('__')])
+        attributes_orig = {k for k in attrs if k[:2] != '__'}
 
         if schema.get('$schema'):
             # todo remove the following as never used?
             # raise
-            ms_uri = schema['$schema']
-            metaschema = resolve_uri(ms_uri)
-            resolver = UriResolver.create(uri=id, schema=schema)
-            meta_validator = DefaultValidator(metaschema, resolver=resolver)
-            meta_validator.validate(schema)
+            type_builder.meta_validator(schema['$schema']).validate(schema)
 
         abstract = schema.get('abstract', False)
 
@@ -558,8 +775,9 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
         negated_aliases = schema.get('negatedAliases', {})
         properties_translation = {}
 
-        # building inner definitions
-        defs = {dn: type_builder.load(f'{id}/$defs/{dn}') for dn, defn in schema.get('$defs', {}).items()}
+        # building inner definitions from their schemas, as for properties (no uri resolution per definition)
+        defs_id = f'{id}/$defs/'
+        defs = {dn: type_builder.build(defs_id + dn, defn) for dn, defn in schema.get('$defs', {}).items()}
 
         # create a dependency dictionary from all bases dependencies
         dependencies = defaultdict(set)
@@ -622,33 +840,15 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
         # exception handling, argument conversion/validation, dependencies, etc...
         add_logging = attrs.get('_add_logging', ADD_LOGGING)
         assert_args = attrs.get('_assert_args', ASSERT_ARGS)
+        decorate = add_logging or assert_args
+        # only existing entries are reassigned: attrs can be iterated without a copy
         for k, v in attrs.items():
-            if isinstance(v, TypeProtocol):
+            # plain isinstance checks: Function.check goes through the whole type checking machinery
+            if isinstance(v, FunctionType):
+                if decorate:
+                    attrs[k] = decorate_method(logger, clsname, k, v, add_logging, assert_args)
+            elif isinstance(v, TypeProtocol):
                 schema[k] = v._schema
-            if Function.check(v):
-                f = v
-                if add_logging:
-                    if k == '__init__':
-                        f = decorators.log_init(f)
-                if assert_args and f.__doc__:
-                    from ..types import Type
-                    fi = inspect_function(f)
-                    if 'assert_arg' in [d['name'] for d in fi.get('decorators', [])]:
-                        # function is already using assert_arg
-                        continue
-                    for pos, a in enumerate(fi['arguments']):
-                        t = a.get('type', False)
-                        if t:
-                            # only assert args which are defined
-                            logger.debug(
-                                "decorate <%s>.%s with argument %i validity check.",
-                                clsname, k, pos)
-                            f = decorators.assert_arg(pos, Type, **a)(f)
-                # add exception logging
-                if add_logging and not k.startswith("__"):
-                    logger.debug("decorate <%s>.%s with exception logger", clsname, k)
-                    f = decorators.log_exceptions(f)
-                attrs[k] = f
 
         # go through attributes to find default values, accessors and additional dependencies
         # store additional data that will be used to rebuild the inner object type with property redefinitions
@@ -733,6 +933,7 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
                     for k, v in pfun.items():
                         if v is not None:
                             setattr(d, f'f{k}', v)
+                    d._setter = compile_setter(pname, d.fset)
                     properties_descriptor[pname] = d
                     break
 
@@ -756,6 +957,7 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
         attrs['_localRelationships'] = local_relationships
         attrs['_relationshipsDescriptor'] = dict(ChainMap(local_relationships_descriptor,
                                                           *[getattr(b, '_relationshipsDescriptor', {}) for b in pbases]))
+        attrs['_load_items'] = compile_loader(dict(attrs['_propertiesDescriptor'], **attrs['_relationshipsDescriptor']))
         attrs['_required'] = required
         attrs['_dependencies'] = dependencies
         attrs['_readOnly'] = read_only
@@ -763,14 +965,25 @@ class ObjectProtocol(ObjectProtocolContext, CollectionProtocol, Object, MutableM
         attrs['_notValidated'] = not_validated
         attrs['_attributesOrig'] = set().union(attributes_orig, *[b._attributesOrig for b in pbases])
         attrs['_propertiesTranslation'] = dict(ChainMap(properties_translation, *[b._propertiesTranslation for b in pbases]))
+        attrs['_propertiesTranslationInv'] = {}
+        for trans, raw in attrs['_propertiesTranslation'].items():
+            attrs['_propertiesTranslationInv'].setdefault(raw, trans)
         attrs['_aliases'] = dict(ChainMap(aliases, *[b._aliases for b in pbases]))
         attrs['_aliasesNegated'] = dict(ChainMap(negated_aliases, *[b._aliasesNegated for b in pbases]))
+        # merged renaming of translated names and aliases, resolved once instead of chained on each check
+        attrs['_propertiesRenamed'] = dict(ChainMap(attrs['_propertiesTranslation'], attrs['_aliases'], attrs['_aliasesNegated']))
         attrs['_propertiesAllowed'] = set(attrs['_properties']).union(attrs['_aliases']).union(attrs['_aliases'].values())\
             .union(attrs['_aliasesNegated']).union(attrs['_aliasesNegated'].values()).union(attrs['_propertiesTranslation']).difference(read_only)
         attrs['_propertiesWithDefault'] = has_default
         attrs['_logger'] = logger
         attrs['_jsValidator'] = DefaultValidator(schema, resolver=UriResolver.create(uri=id, schema=schema))
         attrs['_items_type_cache'] = {}
+        attrs['_items_default_cache'] = {}
+        attrs['_items_default_evaluated_cache'] = {}
+        attrs['_propertiesRaw'] = {}
+        attrs['_propertiesTrans'] = {}
+        attrs['_attributesResolved'] = {}
+        attrs['_attributesSetters'] = {}
         attrs['_mroType'] = pbases
         if 'lazyLoading' in schema:
             attrs['_lazyLoading'] = schema['lazyLoading']
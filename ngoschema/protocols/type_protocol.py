@@ -5,7 +5,8 @@ from __future__ import unicode_literals
 import logging
 import copy
 from abc import abstractmethod
-from collections import OrderedDict, Mapping, Sequence
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
 
 from ..utils import ReadOnlyChainMap, shorten
 from ngoschema.resolvers.uri_resolver import resolve_uri, scope, UriResolver
@@ -164,6 +165,10 @@ class SchemaMetaclass(type):
     the method with the proper check and conversion (default is True).
     """
 
+    # classes only declaring their schema id, by (module, qualname, id, bases), with the schema they were built from
+    _declarative = {}
+    _declarativeAttrs = {'__module__', '__qualname__', '__doc__', '_id'}
+
     def __new__(cls, clsname, bases, attrs):
         from ..managers.type_builder import type_builder
         schema = attrs.get('_schema', {})
@@ -173,12 +178,23 @@ class SchemaMetaclass(type):
         elif bases:
             schema['extends'] = [b._id for b in bases if hasattr(b, '_id')]
         schema.setdefault('type', 'object')
+        # such a class is fully defined by its schema: reuse it while the schema document is the same
+        key = None
+        if id and SchemaMetaclass._declarativeAttrs.issuperset(attrs):
+            key = (attrs.get('__module__'), attrs.get('__qualname__'), id, bases)
+            built = SchemaMetaclass._declarative.get(key)
+            if built and built[0] is schema:
+                type_builder._registry[id] = built[1]
+                return built[1]
         id = id or clsname
         # remove previous entry in registry
         if id in type_builder._registry:
             del type_builder._registry[id]
         attrs['_clsname'] = clsname
-        return type_builder.build(id, schema, bases, attrs=attrs)
+        ret = type_builder.build(id, schema, bases, attrs=attrs)
+        if key:
+            SchemaMetaclass._declarative[key] = (schema, ret)
+        return ret
 
     def __subclasscheck__(cls, subclass):
         """Just modify the behavior for classes that aren't genuine subclasses."""
@@ -30,9 +30,8 @@ class Validator(Converter, Context):
         schema = untype_schema(schema or opts)
         self._schema = ReadOnlyChainMap(schema, self._schema)
         sch = dict(self._schema)
-        type_builder.check_schema(sch)
+        self._jsValidator = type_builder.validator(sch)
         self._default = sch.get('default', self._default)
-        self._jsValidator = DefaultValidator(sch)
 
     @staticmethod
     def _repr_schema(self, **opts):
@@ -12,8 +12,6 @@ import itertools
 import operator
 import re
 
-from python_jsonschema_objects.literals import LiteralValue
-
 from . import utils
 from ngoschema.utils import get_descendant
 
@@ -46,6 +44,7 @@ _operators = [
 def _comparable(obj):
     return obj
     from .protocol_base import ProtocolBase
+    from python_jsonschema_objects.literals import LiteralValue
     if isinstance(obj, ProtocolBase):
         #obj = obj[CN_KEY]
         obj = str(obj.canonicalName)
@@ -402,16 +401,16 @@ class Query(object):
     @property
     def result_cache(self):
         if self._result_cache is None:
-            self._result_cache = list(self._iterable)
+            # sort and reverse the materialized list in place
+            self._result_cache = res = list(self._iterable)
 
             ob = self._order_by
             if ob:
                 from .utils.utils import split_path
                 ks = split_path(ob) if isinstance(ob, str) else ob
-                self._result_cache = sorted(self._result_cache,
-                                            lambda x: get_descendant(x, ks))
-            if self._reverse:
-                self._result_cache = reversed(self._result_cache)
+                res.sort(key=lambda x: get_descendant(x, ks), reverse=bool(self._reverse))
+            elif self._reverse:
+                res.reverse()
         return self._result_cache
 
     def __getitem__(self, k):
@@ -10,7 +10,6 @@ from __future__ import unicode_literals
 
 import os
 import sys
-import six
 import logging
 from abc import abstractmethod
 
@@ -35,7 +34,7 @@ from ..managers.type_builder import wrap
 from ..serializers.file_serializer import FileSaver
 from ..serializers.json_serializer import JsonSerializer
 from ..serializers.xml_serializer import XmlSerializer
-from ..serializers.yaml_serializer import YamlSerializer
+from ..serializers.yaml_serializer import YamlSerializer, _is_plain, _yaml_dump_plain, _allows_unicode
 from ..protocols import SchemaMetaclass, with_metaclass
 from ..protocols.object_protocol import ObjectProtocol
 from ..types.object import Serializer, ObjectSerializer, ObjectDeserializer, Object
@@ -134,6 +133,8 @@ class YamlFileRepository(with_metaclass(SchemaMetaclass)):
         return data
 
     def serialize_data(self, data):
+        if _is_plain(data):
+            return _yaml_dump_plain(data, self.get("indent", 2), _allows_unicode(self.get("encoding", "utf-8")))
         yaml.indent = self.get("indent", 2)
         yaml.allow_unicode = self.get("encoding", "utf-8") == "utf-8"
 
@@ -21,6 +21,9 @@ class MemoryRepository(with_metaclass(SchemaMetaclass, Repository)):
         Repository.__init__(self, **(meta_opts or {}), **self)
         self._catalog = OrderedDict()
         self._content = Array(items=self._instanceClass, maxItems=1 if not self._many else None)(value)
+        if self._many:
+            for c in self._content:
+                self._catalog[c.identityKeys] = c
 
     def __contains__(self, item):
         return item in self._catalog
@@ -28,6 +31,19 @@ class MemoryRepository(with_metaclass(SchemaMetaclass, Repository)):
     def resolve_fkey(self, identity_keys):
         return self._catalog[identity_keys]
 
+    def query(self, *attrs, **attrs_value):
+        from ..query import Query
+        # filters on the full primary key: only scan the entry indexed by the catalog
+        pks = getattr(self._instanceClass, '_primaryKeys', None)
+        if self._many and pks and not attrs and all(k in attrs_value for k in pks):
+            try:
+                c = self._catalog.get(tuple(attrs_value[k] for k in pks))
+            except TypeError:  # unhashable key values
+                c = None
+            if c is not None:
+                return Query([c]).get(**attrs_value)
+        return Query(self._content).get(*attrs, **attrs_value)
+
     @staticmethod
     def _commit(self, value, save=False, **opts):
         """ optionally load the value (at least validate it) and add it to content """
@@ -41,13 +57,16 @@ class MemoryRepository(with_metaclass(SchemaMetaclass, Repository)):
                     k = max([-1] + iks) + 1
                     value._set_data(value.primaryKeys[i], k)
             pk = value.identityKeys
-            self._catalog[value._identityKeys] = value
-            for i, c in enumerate(self._content):
-                if pk == c.identityKeys:
-                    self._content[i] = value
-                    break
-            else:
+            prev = self._catalog.get(pk)
+            self._catalog[pk] = value
+            if prev is None:
                 self._content.append(value)
+            else:
+                # the catalog already indexes content by identity keys
+                for i, c in enumerate(self._content):
+                    if c is prev:
+                        self._content[i] = value
+                        break
         else:
             self._content = self._content(value)
         return self._content
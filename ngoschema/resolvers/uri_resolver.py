@@ -140,9 +140,10 @@ class UriResolver(RefResolver):
         if doc_uri in UriResolver._doc_store:
             return UriResolver(doc_uri, UriResolver._doc_store[doc_uri])
         # not in doc store, create a resolver with a copy
+        # (of the underlying dict, whose keys are already normalized)
         if schema is None:
             schema = resolve_uri(uri)
-        return UriResolver(uri, schema, store=dict(UriResolver._doc_store))
+        return UriResolver(uri, schema, store=dict(UriResolver._doc_store._dict))
 
     def _expand(self, uri, schema, doc_scope):
         """ expand a schema to add properties of all definitions it extends
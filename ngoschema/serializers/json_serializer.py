@@ -11,7 +11,6 @@ from __future__ import unicode_literals
 import collections
 import json
 
-import six
 from datetime import date, datetime, time, timedelta
 from pathlib import Path
 from ..protocols import SchemaMetaclass, with_metaclass, ObjectProtocol
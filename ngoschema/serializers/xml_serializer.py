@@ -96,10 +96,6 @@ class XmlSerializer(with_metaclass(SchemaMetaclass, Serializer, XmlDeserializer)
 
         self._postprocessor = opts.get('postprocessor', default_postprocessor)
 
-    @staticmethod
-    def _serialize(self, value, **opts):
-        return XmlSerializer._serialize_xml(self, value, **opts)
-
     @staticmethod
     def _serialize_xml(self, value, **opts):
         value = Serializer._serialize(self, value, **opts)
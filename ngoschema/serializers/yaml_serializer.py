@@ -2,6 +2,10 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import codecs
+import json
+import re
+
 from ruamel import yaml
 from ruamel.yaml import YAML
 try:
@@ -13,6 +17,98 @@ from ..registries import deserializers_registry, serializers_registry
 from ..protocols import Deserializer, Serializer
 from ..protocols import SchemaMetaclass, with_metaclass, ObjectProtocol
 
+_PLAIN_SCALARS = (str, int, float, bool, type(None))
+_PLAIN_STR_REGEX = re.compile(r'^[A-Za-z_][\w./-]*( [\w./-]+)*$', re.ASCII)
+# characters json leaves raw in strings which yaml does not read back as such
+_YAML_UNSAFE_REGEX = re.compile('[\x7f-\x9f\u2028\u2029\ud800-\udfff\ufeff\ufffe\uffff]')
+_YAML_UNSAFE_ASCII_REGEX = re.compile('[^\x00-\x7e]')
+_YAML_RESERVED = {'y', 'n', 'yes', 'no', 'on', 'off', 'true', 'false', 'null', '~'}
+
+
+def _is_plain(data):
+    """Check recursively that data is only made of dicts with string keys, lists and json scalars."""
+    if isinstance(data, dict):
+        return all(isinstance(k, str) and _is_plain(v) for k, v in data.items())
+    if isinstance(data, (list, tuple)):
+        return all(_is_plain(v) for v in data)
+    return isinstance(data, _PLAIN_SCALARS)
+
+
+def _allows_unicode(encoding):
+    """Check if an output encoding can write any unicode character."""
+    try:
+        return codecs.lookup(encoding).name.startswith('utf')
+    except (LookupError, TypeError):
+        return False
+
+
+def _yaml_escape(match):
+    c = ord(match.group())
+    return '\\x%02X' % c if c <= 0xff else '\\u%04X' % c if c <= 0xffff else '\\U%08X' % c
+
+
+def _yaml_scalar(value, allow_unicode=True):
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if isinstance(value, float):
+        if value != value:
+            return '.nan'
+        if value in (float('inf'), float('-inf')):
+            return '.inf' if value > 0 else '-.inf'
+        return repr(value)
+    if isinstance(value, int):
+        return str(value)
+    if _PLAIN_STR_REGEX.match(value) and value.lower() not in _YAML_RESERVED:
+        return value
+    # json double quoted strings are yaml double quoted scalars, once remaining unsafe characters are escaped
+    unsafe = _YAML_UNSAFE_REGEX if allow_unicode else _YAML_UNSAFE_ASCII_REGEX
+    return unsafe.sub(_yaml_escape, json.dumps(value, ensure_ascii=False))
+
+
+def _yaml_inline(value, allow_unicode=True):
+    if isinstance(value, dict):
+        return '{}'
+    if isinstance(value, (list, tuple)):
+        return '[]'
+    return _yaml_scalar(value, allow_unicode)
+
+
+def _yaml_dump_plain(data, indent=2, allow_unicode=True):
+    """Emit plain data (see `_is_plain`) as block style yaml, bypassing ruamel event emitter.
+    Without `allow_unicode`, non ascii characters are escaped in double quoted strings."""
+    frags = []
+    scalar = lambda v: _yaml_scalar(v, allow_unicode)
+    inline = lambda v: _yaml_inline(v, allow_unicode)
+
+    def emit(value, level):
+        pad = ' ' * level
+        if isinstance(value, dict):
+            for k, v in value.items():
+                if v and isinstance(v, (dict, list, tuple)):
+                    frags.append(f'{pad}{scalar(k)}:\n')
+                    emit(v, level + indent)
+                else:
+                    frags.append(f'{pad}{scalar(k)}: {inline(v)}\n')
+        else:
+            for v in value:
+                if v and isinstance(v, (dict, list, tuple)):
+                    # emit item at deeper level and replace its first indentation by the dash
+                    i = len(frags)
+                    emit(v, level + 2)
+                    frags[i] = f'{pad}- {frags[i][level + 2:]}'
+                else:
+                    frags.append(f'{pad}- {inline(v)}\n')
+
+    if data and isinstance(data, (dict, list, tuple)):
+        emit(data, 0)
+    else:
+        frags.append(f'{inline(data)}\n')
+    return ''.join(frags)
+
 
 @deserializers_registry.register('yaml')
 class YamlDeserializer(Deserializer):
@@ -51,8 +147,13 @@ class YamlSerializer(with_metaclass(SchemaMetaclass, Serializer, YamlDeserialize
 
     @staticmethod
     def _serialize_yaml(self, value, **opts):
+        indent = opts.get('indent', self._indent)
+        if _is_plain(value):
+            # fast path for json-like data
+            allow_unicode = _allows_unicode(opts.get('charset', self._charset))
+            return Serializer._serialize(self, _yaml_dump_plain(value, indent, allow_unicode), **opts)
         __doc__ = self._yaml.safe_dump.__doc__
-        yaml.indent = opts.get('indent', self._indent)
+        yaml.indent = indent
         yaml.allow_unicode = opts.get('charset', self._charset)
         output = StringIO()
         self._yaml.safe_dump(value, output, default_flow_style=False, **opts)
@@ -17,7 +17,6 @@ from . import utils
 from .decorators import assert_arg
 from .protocols import ObjectProtocol, ArrayProtocol, SchemaMetaclass, with_metaclass
 from .types import Tuple, Array
-from .query import Query
 
 _sessions = weakref.WeakValueDictionary()
 
@@ -45,11 +44,21 @@ class Session(with_metaclass(SchemaMetaclass)):
         self._new = {}  # InstanceState->object, strong refs object
         self._deleted = {}  # same
         self._hash_key = _new_sessionid()
+        self._reposByClass = {}
         _sessions[self._hash_key] = self
 
     def bind_repo(self, repo):
         self.repositories.append(repo)
         repo._session = self
+        self._reposByClass.clear()
+
+    def repos_for(self, object_class):
+        """Return the bound repositories whose instances are subclasses of `object_class`"""
+        repos = self._reposByClass.get(object_class)
+        if repos is None:
+            repos = self._reposByClass[object_class] = [r for r in self.repositories
+                                                         if issubclass(r.instanceClass, object_class)]
+        return repos
 
     def get_or_create_repo(self, name):
         for r in self.repositories:
@@ -76,19 +85,12 @@ class Session(with_metaclass(SchemaMetaclass)):
 
     @assert_arg(1, Tuple, strDelimiter=',')
     def resolve_fkey(self, keys, object_class):
-        for repo in [r for r in self.repositories if issubclass(r.instanceClass, object_class)]:
+        for repo in self.repos_for(object_class):
             if keys in repo:
                 return repo.resolve_fkey(keys)
         else:
             raise Exception("Impossible to resolve '%s'" % keys)
 
-    def query(self, *attrs, order_by=False, **attrs_value):
-        """
-        Make a `Query` on registered documents
-        """
-        return Query(self._chained.values()).filter(
-            *attrs, order_by=order_by, **attrs_value)
-
     def commit(self):
         pass
 
@@ -2,7 +2,8 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
-from collections import Mapping, Sequence, deque, OrderedDict
+from collections import deque, OrderedDict
+from collections.abc import Mapping, Sequence
 
 from ..exceptions import ValidationError, ConversionError
 from ..utils import ReadOnlyChainMap as ChainMap
@@ -2,7 +2,8 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
-from collections import OrderedDict, defaultdict, Mapping, Sequence
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping, Sequence
 import re
 
 from .. import settings
@@ -153,9 +154,7 @@ class ForeignKey(Ref):
     @assert_arg(1, Tuple, strDelimiter=',')
     def _resolve(self, key, session=None, **opts):
         session = session or scoped_session(session_maker())()
-        ric = [r.instanceClass for r in session.repositories]
-        fc_repos = [r for r in session.repositories if issubclass(r.instanceClass, self._foreignClass)]
-        for r in fc_repos:
+        for r in session.repos_for(self._foreignClass):
             # change resolve_fkey to use resolve??
             v = r.resolve_fkey(key)
             if v is not None:
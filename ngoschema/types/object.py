@@ -2,8 +2,10 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
-from collections import OrderedDict, defaultdict, Mapping, MutableMapping
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping, MutableMapping
 import re
+import decimal
 from operator import neg
 
 from ..exceptions import InvalidValue
@@ -16,6 +18,9 @@ from .type import Type
 from .strings import Pattern
 from .collection import CollectionDeserializer, CollectionSerializer, Collection
 
+# defaults of these types can be shared between instances
+_IMMUTABLE_DEFAULTS = (str, int, float, decimal.Decimal)
+
 
 class ObjectDeserializer(CollectionDeserializer):
     _collType = OrderedDict
@@ -89,7 +94,8 @@ class ObjectSerializer(CollectionSerializer, ObjectDeserializer):
         no_defaults = opts.get('no_defaults', self._noDefaults)
         no_readOnly = opts.get('no_readOnly', self._noReadOnly)
         if no_readOnly:
-            excludes += list(self._readOnly)
+            # do not extend the default argument in place
+            excludes = set(excludes).union(self._readOnly)
         for k in all_ordered:
             if k in self._required:
                 yield k
@@ -114,6 +120,7 @@ class Object(Collection, ObjectSerializer):
     _propertiesPattern = set()
     _propertiesAdditional = _True()
     _propertiesWithDefault = set()
+    _items_default_cache = None
 
     @classmethod
     def is_object(cls):
@@ -143,6 +150,7 @@ class Object(Collection, ObjectSerializer):
         self._propertiesWithDefault = set(k for k, t in self._properties.items() if t.has_default())
         self._required.difference_update(self._propertiesWithDefault)
         self._items_type_cache = {}
+        self._items_default_cache = {}
 
     def __call__(self, value=None, **opts):
         value = value or opts  # to allow initialization by keywords
@@ -153,6 +161,17 @@ class Object(Collection, ObjectSerializer):
     def _items_types(self, value, **opts):
         return [(k, self._items_type(self, k)) for k in list(value)]
 
+    @staticmethod
+    def _items_default(self, item, **opts):
+        """Returns the raw default of a property, cached when immutable."""
+        cache = self._items_default_cache
+        if item in cache:
+            return cache[item]
+        d = self._items_type(self, item).default(raw_literals=True, **opts)
+        if isinstance(d, _IMMUTABLE_DEFAULTS):
+            cache[item] = d
+        return d
+
     @staticmethod
     def _items_type(self, item):
         """Returns the type of a property by its name."""
@@ -199,15 +218,16 @@ class Object(Collection, ObjectSerializer):
 
     @staticmethod
     def _null(self, value, items=False, **opts):
-        return self._collType([(k, None) for k in self._print_order(self, value, items=items, **opts)])
+        return self._collType.fromkeys(self._print_order(self, value, items=items, **opts))
 
     @staticmethod
     def _deserialize(self, value, items=True, evaluate=True, raw_literals=False, **opts):
         value = self._collType(value or self._default)
         #value = ObjectDeserializer._deserialize(self, value, items=False, evaluate=evaluate, **opts)
-        value.update({k: self._items_type(self, k).default(raw_literals=True, evaluate=evaluate, **opts)
+        value.update({k: self._items_default(self, k, evaluate=evaluate, **opts)
                       for k in self._propertiesWithDefault if k not in value})
-        value.update({k: None for k in self._properties.keys() if k not in value})
+        for k in self._properties:
+            value.setdefault(k, None)
         value = self._collType([(k, value[k]) for k in self._call_order(self, value, items=items, **opts)])
         value = Collection._deserialize(self, value, items=items, evaluate=evaluate, raw_literals=raw_literals, **opts)
         return value
@@ -245,10 +265,11 @@ class Object(Collection, ObjectSerializer):
         context = opts.pop('context', self._context)
         for k in ObjectSerializer._print_order(self, value, no_defaults=no_defaults, **opts):
             if no_defaults:
-                t = self._items_type(self, k)
                 v = value[k]
-                if t._has_default(t):
-                    d = t.default(context=context, raw_literals=True)
+                t = self._items_type(self, k)
+                # a missing value never equals a default: skip its evaluation
+                if v is not None and t._has_default(t):
+                    d = self._items_default(self, k, context=context)
                     d = t(d, context=context)
                     v = neg(v) if k in self._aliasesNegated else v
                     #if t.is_primitive():
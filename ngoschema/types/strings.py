@@ -49,6 +49,13 @@ class Expr(String):
             return value
         raise TypeError('%s is not of type "expr".' % value)
 
+    @classmethod
+    def check(cls, value, convert=False, validate=False, **opts):
+        # plain type probe, called on every item evaluation
+        if not convert and not validate:
+            return isinstance(value, str) and value.startswith("`")
+        return String.check.__func__(cls, value, convert=convert, validate=validate, **opts)
+
     @staticmethod
     def _convert(self, value, context=None, **opts):
         context = context or self._context
@@ -70,6 +77,13 @@ class Pattern(String):
             return value
         raise TypeError('%s is not of type "pattern".' % value)
 
+    @classmethod
+    def check(cls, value, convert=False, validate=False, **opts):
+        # plain type probe, called on every item evaluation
+        if not convert and not validate:
+            return isinstance(value, str) and ("{{" in value or "{%" in value)
+        return String.check.__func__(cls, value, convert=convert, validate=validate, **opts)
+
     @staticmethod
     def _convert(self, value, context=None, **opts):
         ctx = (context or self.create_context(**opts)).merged
@@ -17,6 +17,9 @@ from .object import Object
 
 logger = logging.getLogger(__name__)
 
+# symbols already imported by dotted name (failed imports are not kept)
+_imported_symbols = {}
+
 
 @register_type('importable')
 class Symbol(Primitive):
@@ -32,6 +35,12 @@ class Symbol(Primitive):
         typed = self._builtins.get(value, value)
         if String.check(typed):
             value = String.convert(typed, **opts)
+            imported = _imported_symbols.get(value)
+            if imported is not None:
+                typed = imported
+                if not self.check_symbol(typed):
+                    raise ConversionError("%s is not a %s" % (value, self._type))
+                return typed
             poss = [m.start() for m in Symbol.DOT.finditer("%s." % typed)]
             # going backwards
             for pos in reversed(poss):
@@ -44,7 +53,7 @@ class Symbol(Primitive):
                         ret = getattr(ret, a, None)
                         if not ret:
                             raise ConversionError("%s is not an importable object" % value)
-                    typed = ret
+                    typed = _imported_symbols[value] = ret
                     break
                 except Exception as er:
                     continue
@@ -2,7 +2,13 @@ from .jinja2 import *
 from .utils import *
 from .str_utils import *
 from ._qualname import *
-from python_jsonschema_objects.util import resolve_ref_uri
+
+
+def resolve_ref_uri(base, ref):
+    # python_jsonschema_objects is heavy to import (markdown support), only load it when used
+    from python_jsonschema_objects.util import resolve_ref_uri
+    return resolve_ref_uri(base, ref)
+
 
 __all__ = [
     'resolve_ref_uri',
@@ -52,6 +52,12 @@ def default_jinja2_env():
 regex_has_dot = re.compile(r"(\{\{\s*\w+\.)")
 
 
+@functools.lru_cache(512)
+def _jinja2_template(source):
+    """compile a source in the default environment, memoized as the same patterns are rendered repeatedly"""
+    return default_jinja2_env().from_string(source)
+
+
 class TemplatedString(object):
     """
     Returns a templated string for a given context
@@ -59,7 +65,7 @@ class TemplatedString(object):
 
     def __init__(self, templated_str):
         self._templated_str = str(templated_str)
-        self._template = default_jinja2_env().from_string(self._templated_str)
+        self._template = _jinja2_template(self._templated_str)
         self._has_dot = regex_has_dot.search(self._templated_str) is not None
 
     def __call__(self, *args, **kwargs):
@@ -93,6 +99,16 @@ def get_jinja2_variables(source, remove_this=True):
         else [v.replace('this.', '').replace('self.', '') for v in vars]
 
 # ADDITIONAL FILTERS FROM INFLECTION
+# inflections are regex based and depend only on their arguments: memoize them
+_camelize = functools.lru_cache(maxsize=1024)(inflection.camelize)
+_dasherize = functools.lru_cache(maxsize=1024)(inflection.dasherize)
+_parameterize = functools.lru_cache(maxsize=1024)(inflection.parameterize)
+_pluralize = functools.lru_cache(maxsize=1024)(inflection.pluralize)
+_singularize = functools.lru_cache(maxsize=1024)(inflection.singularize)
+_tableize = functools.lru_cache(maxsize=1024)(inflection.tableize)
+_titleize = functools.lru_cache(maxsize=1024)(inflection.titleize)
+_transliterate = functools.lru_cache(maxsize=1024)(inflection.transliterate)
+_underscore = functools.lru_cache(maxsize=1024)(inflection.underscore)
 
 
 filters_registry = GenericClassRegistry()
@@ -101,13 +117,13 @@ filters_registry = GenericClassRegistry()
 @filters_registry.register()
 def camelize(string, uppercase_first_letter=True):
     __doc__ = inflection.camelize.__doc__
-    return inflection.camelize(str(string), uppercase_first_letter)
+    return _camelize(str(string), uppercase_first_letter)
 
 
 @filters_registry.register()
 def dasherize(word):
     __doc__ = inflection.dasherize.__doc__
-    return inflection.dasherize(str(word))
+    return _dasherize(str(word))
 
 
 @filters_registry.register()
@@ -125,43 +141,43 @@ def ordinalize(number):
 @filters_registry.register()
 def parameterize(string, separator="-"):
     __doc__ = inflection.parameterize.__doc__
-    return inflection.parameterize(str(string), separator)
+    return _parameterize(str(string), separator)
 
 
 @filters_registry.register()
 def pluralize(word):
     __doc__ = inflection.pluralize.__doc__
-    return inflection.pluralize(str(word))
+    return _pluralize(str(word))
 
 
 @filters_registry.register()
 def singularize(word):
     __doc__ = inflection.singularize.__doc__
-    return inflection.singularize(str(word))
+    return _singularize(str(word))
 
 
 @filters_registry.register()
 def tableize(word):
     __doc__ = inflection.tableize.__doc__
-    return inflection.tableize(str(word))
+    return _tableize(str(word))
 
 
 @filters_registry.register()
 def titleize(word):
     __doc__ = inflection.titleize.__doc__
-    return inflection.titleize(str(word))
+    return _titleize(str(word))
 
 
 @filters_registry.register()
 def transliterate(string):
     __doc__ = inflection.transliterate.__doc__
-    return inflection.transliterate(str(string))
+    return _transliterate(str(string))
 
 
 @filters_registry.register()
 def underscore(word):
     __doc__ = inflection.underscore.__doc__
-    return inflection.underscore(str(word))
+    return _underscore(str(word))
 
 
 @filters_registry.register()
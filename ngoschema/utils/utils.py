@@ -11,6 +11,7 @@ from __future__ import unicode_literals
 
 import os
 import collections
+import collections.abc
 from pyrsistent import pmap
 import copy
 import importlib
@@ -29,7 +30,6 @@ import weakref
 from urllib.parse import urlsplit
 import functools
 
-import six
 from ngofile.pathlist import PathList
 from past.types import basestring
 from jsonschema._types import is_integer
@@ -37,13 +37,16 @@ from jsonschema._types import is_integer
 from ngoschema.utils._qualname import qualname
 from ngoschema.exceptions import InvalidValue
 from collections import OrderedDict as odict
-from collections import Mapping, MutableMapping
+from collections.abc import Mapping, MutableMapping
 
 
 class ReadOnlyChainMap(Mapping):
+    # chain maps are created for each context and derived schema: no instance dictionary
+    __slots__ = ('_maps', '_maps_flattened')
 
     def __init__(self, *maps):
         self._maps = [m for m in maps]
+        self._maps_flattened = None
 
     @property
     def maps(self):
@@ -95,7 +98,6 @@ class ReadOnlyChainMap(Mapping):
     def __str__(self):
         return str(self.merged)
 
-    _maps_flattened = None
     @property
     def maps_flattened(self):
         if self._maps_flattened is None:
@@ -118,10 +120,12 @@ class ReadOnlyChainMap(Mapping):
 
 
 class Context(ReadOnlyChainMap):
+    __slots__ = ('_local', '_parents', '_session')
 
     def __init__(self, *parents, **local):
         self._local = local
         self._parents = parents
+        self._session = None
         ReadOnlyChainMap.__init__(self, local, *parents)
 
     def __enter__(self):
@@ -220,7 +224,7 @@ class Registry(Mapping):
         return self._registry[key]
 
     def __iter__(self):
-        return six.iterkeys(self._registry)
+        return iter(self._registry)
 
     def __len__(self):
         return len(self._registry)
@@ -341,7 +345,7 @@ def is_mapping(value):
     """
     Test if value is a mapping (dict, ordered dict, ...)
     """
-    if isinstance(value, collections.Mapping):
+    if isinstance(value, collections.abc.Mapping):
         return True
     return False
 
@@ -351,7 +355,7 @@ def is_sequence(value):
     Test if value is a sequence (list, tuple, deque)
     """
     if isinstance(value,
-                  collections.Sequence) and not isinstance(value, basestring):
+                  collections.abc.Sequence) and not isinstance(value, basestring):
         return True
     if isinstance(value, collections.deque):
         return True
@@ -368,7 +372,7 @@ def is_collection(value):
         return True
     if is_sequence(value):
         return True
-    if isinstance(value, collections.Set):
+    if isinstance(value, collections.abc.Set):
         return True
     return False
 
@@ -473,7 +477,7 @@ def nested_dict_iter(nested, separator='.'):
     generator going through a nested dictionary and returning a canonical name / value
     """
     for key, value in nested.items():
-        if isinstance(value, collections.Mapping):
+        if isinstance(value, collections.abc.Mapping):
             for inner_key, inner_value in nested_dict_iter(value):
                 yield f'{key}{separator}{inner_key}', inner_value
         else:
@@ -500,9 +504,9 @@ def logging_call(popenargs,
     enc = sys.stdout.encoding or "cp850"
     if out:
 
-        _logger.log(stdout_log_level, six.text_type(out, enc, errors='ignore'))
+        _logger.log(stdout_log_level, str(out, enc, errors='ignore'))
     if err:
-        _logger.log(stderr_log_level, six.text_type(err, enc, errors='ignore'))
+        _logger.log(stderr_log_level, str(err, enc, errors='ignore'))
 
 
 def grouper( page_size, iterable ):
@@ -664,14 +668,14 @@ def get_descendant(obj, key_list):
     """
     if is_string(key_list):
         key_list = split_path(key_list)
-    k0 = key_list[0]
-
-    try:
-        child = obj[k0]
-    except Exception as er:
-        child = None
-    return get_descendant(child, key_list[1:]) \
-        if child and len(key_list) > 1 else child
+    for k in key_list:
+        try:
+            obj = obj[k]
+        except Exception:
+            return None
+        if not obj:
+            return obj
+    return obj
 
 
 def topological_sort(data):
@@ -111,7 +111,10 @@ test_requires = [
     'pytest-logger',
 ]
 
-extras_requires = {}
+extras_requires = {
+    # faster parsing of schema files
+    'orjson': ['orjson'],
+}
 
 setup(
     name=name,
@@ -112,6 +112,18 @@ def test_decorators():
         a.bar3(integer=1)
 
 
+def test_assert_arg_errors():
+    # exceptions raised by the decorated function are not turned into validation errors
+    @assert_arg(0, Integer)
+    def inverse(i):
+        return 1 / i
+
+    assert inverse("2") == 0.5
+    with pytest.raises(ZeroDivisionError) as e_info:
+        inverse(0)
+
+
 if __name__ == "__main__":
     test_decorators()
+    test_assert_arg_errors()
 # pytest.main(__file__)
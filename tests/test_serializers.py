@@ -0,0 +1,36 @@
+from ruamel.yaml import YAML
+from ngoschema.serializers.yaml_serializer import _is_plain, _yaml_dump_plain, _allows_unicode
+
+
+def test_yaml_dump_plain():
+    data = {
+        'a': 1,
+        'b': [1, 2.5, {'c': 'hello world', 'd': [[1, 2], [], {}], 'e': None}],
+        'f': {'g': True, 'h': 'yes', 'i': 'a: b', 'j': '', 'k': 'multi\nline', '$schema': 'http://x#/a'},
+        'l': [[{'m': 1, 'n': 2}, 3]],
+        'q': '123',
+        'v': float('inf'),
+    }
+    assert _is_plain(data)
+    assert not _is_plain({1: 'a'})
+    assert not _is_plain({'a': object()})
+    assert YAML(typ='safe').load(_yaml_dump_plain(data)) == data
+    assert _yaml_dump_plain({'a': [1, 2]}, indent=4) == 'a:\n    - 1\n    - 2\n'
+
+
+def test_yaml_dump_plain_escapes():
+    data = {'del': 'x\x7fy', 'nel': 'x\x85y', 'ls': 'x\u2028y', 'bom': '\ufeffx', 'name': 'café', 'e': '\U0001f600'}
+    yml = YAML(typ='safe')
+    assert yml.load(_yaml_dump_plain(data)) == data
+    # without unicode output, non ascii characters are escaped
+    ascii_dump = _yaml_dump_plain(data, allow_unicode=False)
+    assert ascii_dump.isascii()
+    assert yml.load(ascii_dump) == data
+    assert _yaml_dump_plain({'name': 'café'}) == 'name: "café"\n'
+    assert _yaml_dump_plain({'name': 'café'}, allow_unicode=False) == 'name: "caf\\xE9"\n'
+    assert _allows_unicode('UTF-8') and not _allows_unicode('ascii') and not _allows_unicode('latin-1')
+
+
+if __name__ == "__main__":
+    test_yaml_dump_plain()
+    test_yaml_dump_plain_escapes()
@@ -139,9 +139,28 @@ def test_canonical_name():
         cn.resolve('A.c')
 
 
+def test_shared_validator():
+    # types instantiated with the same schema share their json-schema validator
+    s1, s2 = types.String(maxLength=3), types.String(maxLength=3)
+    assert s1._jsValidator is s2._jsValidator
+    assert types.String(maxLength=4)._jsValidator is not s1._jsValidator
+    assert s2('abc') == 'abc'
+    with pytest.raises(InvalidValue) as e_info:
+        s2('abcd')
+
+
+def test_first_error():
+    from ngoschema.managers.jsch_validators import first_error
+    v = types.String(maxLength=3)._jsValidator
+    assert first_error(v, 'abc') is None
+    assert first_error(v, 'abcd').validator == 'maxLength'
+
+
 if __name__ == '__main__':
     #test_canonical_name()
     test_object()
     test_base()
     test_array()
     test_complex()
+    test_shared_validator()
+    test_first_error()
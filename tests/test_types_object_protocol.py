@@ -1,3 +1,4 @@
+import logging
 import pytest
 
 from future.utils import with_metaclass
@@ -118,6 +119,13 @@ def test_schema_mro():
     assert mro
 
 
+def test_schema_mro_diamond():
+    from ngoschema.types import type_builder
+    load_schema({'$id': 'C', 'type': 'object', 'extends': ['A']})
+    load_schema({'$id': 'D', 'type': 'object', 'extends': ['BextA', 'C']})
+    assert list(type_builder.schema_mro('D')) == ['BextA', 'A', 'C']
+
+
 def test_repr():
     class Obj(with_metaclass(SchemaMetaclass)):
         _schema = {
@@ -151,6 +159,116 @@ def test_repr():
     print(str(a1))
 
 
+def test_eq():
+    class A(with_metaclass(SchemaMetaclass)):
+        _id = 'A'
+
+    assert A(a=1) == A(a='1')
+    assert A(a=1) != A(a=2)
+    assert A(a=1) == {'a': '1'}
+    # non mapping operands are never equal
+    assert not (A(a=1) == None)
+    assert A(a=1) != [1]
+
+
+def test_set_unchanged():
+    class A(with_metaclass(SchemaMetaclass)):
+        _id = 'A'
+
+    a = A(a=1)
+    a.do_validate()
+    assert a._isValidated
+    # reassigning the current value does not touch the object
+    a.a = a.a
+    assert a._isValidated
+    a.a = 2
+    assert not a._isValidated
+    assert a.a == '2'
+
+
+def test_literal_defaults():
+    load_schema({
+        '$id': 'Dft',
+        'type': 'object',
+        'properties': {
+            'a': {'type': 'integer', 'default': 3},
+            'n': {'type': 'number', 'default': '2'},
+            's': {'type': 'string', 'default': 'x{{a}}'},
+        }
+    })
+
+    class Dft(with_metaclass(SchemaMetaclass)):
+        _id = 'Dft'
+
+    d1 = Dft()
+    assert (d1.a, d1.n, d1.s) == (3, 2, 'x3')
+    # constant defaults are evaluated once, patterns are evaluated per instance
+    d2 = Dft(a=4)
+    assert (d2.a, d2.n, d2.s) == (4, 2, 'x4')
+    assert 's' not in Dft._items_default_evaluated_cache
+
+
+def test_context_defaults():
+    from ngoschema.protocols.context import DEFAULT_CONTEXT
+    from ngoschema.managers.namespace_manager import NamespaceManager
+    load_schema({
+        '$id': 'DftCtx',
+        'type': 'object',
+        'properties': {
+            'i': {'type': 'id', 'default': 'foo'},
+        }
+    })
+
+    class DftCtx(with_metaclass(SchemaMetaclass)):
+        _id = 'DftCtx'
+
+    def ns_context(uri):
+        ns_mgr = NamespaceManager(**{'': uri})
+        ns_mgr.set_current('')
+        return DEFAULT_CONTEXT.create_child(ns_mgr)
+
+    # ids are scoped in the current namespace of the context: their defaults are evaluated per instance
+    assert DftCtx(context=ns_context('https://a.org/doc#')).i == 'https://a.org/doc#/$defs/foo'
+    assert DftCtx(context=ns_context('https://b.org/doc#')).i == 'https://b.org/doc#/$defs/foo'
+    assert 'i' not in DftCtx._items_default_evaluated_cache
+
+
+def test_decorated_methods_freed():
+    import gc
+    import weakref
+    from ngoschema.protocols.object_protocol import decorate_method
+    refs = []
+    for i in range(10):
+        def method(self, x):
+            """return x"""
+            return x
+        decorated = decorate_method(logging.getLogger(__name__), 'C', f'm{i}', method, True, True)
+        # decorations are shared between classes
+        assert decorate_method(logging.getLogger(__name__), 'C', f'm{i}', method, True, True) is decorated
+        refs.append(weakref.ref(method))
+    del method, decorated
+    gc.collect()
+    assert not any(r() for r in refs)
+
+
+def test_set_relationship():
+    from ngoschema.models.instances import Entity
+    load_schema({'$id': 'RelOwner', 'type': 'object', 'extends': [Entity._id], 'primaryKeys': ['id'],
+                 'properties': {'id': {'type': 'integer'}}})
+    load_schema({'$id': 'RelPet', 'type': 'object',
+                 'properties': {'owner': {'type': 'integer', 'foreignKey': {'foreignSchema': 'RelOwner'}}}})
+
+    class RelOwner(with_metaclass(SchemaMetaclass)):
+        _id = 'RelOwner'
+
+    class RelPet(with_metaclass(SchemaMetaclass)):
+        _id = 'RelPet'
+
+    p = RelPet()
+    p.owner_ptr = RelOwner(id=3)
+    assert p.owner == 3
+
+
 def test_repr2():
     from ngoschema.models.files import Document
     print(repr(Document._properties))
@@ -162,5 +280,11 @@ if __name__ == "__main__":
     test_object_protocol()
     test_call_order()
     test_repr()
+    test_eq()
+    test_set_unchanged()
+    test_literal_defaults()
+    test_context_defaults()
+    test_decorated_methods_freed()
+    test_set_relationship()
 
     #test_schema_mro()
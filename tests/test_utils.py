@@ -143,7 +143,45 @@ def test_class_casted_as():
 
 
 
+def test_get_descendant():
+    from ngoschema.utils import get_descendant
+    d = {'a': {'b': [1, {'c': 3}]}, 'z': 0}
+    assert get_descendant(d, ['a', 'b', 1, 'c']) == 3
+    assert get_descendant(d, ['a', 'x', 'c']) is None
+    assert get_descendant(d, ['z', 'q']) == 0
+
+
+def test_load_schema_file_copy():
+    import json
+    import tempfile
+    from ngoschema.loaders.schemas import load_schema_file
+    with tempfile.TemporaryDirectory() as tmp:
+        fp = pathlib.Path(tmp, 'schema_copy.json')
+        fp.write_text(json.dumps({'$id': 'https://numengo.org/tests/schema_copy', 'title': 'copy'}))
+        uri, schema = load_schema_file(fp)
+        schema['title'] = 'modified'
+        schema['type'] = 'object'
+        # unchanged file: the cached document is not affected by changes of a loaded schema
+        uri, schema = load_schema_file(fp)
+        assert schema == {'$id': 'https://numengo.org/tests/schema_copy', 'title': 'copy'}
+
+
+def test_clear_schema_files_cache():
+    from ngoschema.loaders import module
+    from ngoschema.loaders.schemas import clear_schema_files_cache
+    module.load_module_schemas('ngoschema')
+    assert module._schema_folder_files
+    # the walked schema folders are forgotten with the parsed schema files
+    clear_schema_files_cache()
+    assert not module._schema_folder_files
+    module.load_module_schemas('ngoschema')
+    assert module._schema_folder_files
+
+
 if __name__ == "__main__":
+    test_get_descendant()
+    test_load_schema_file_copy()
+    test_clear_schema_files_cache()
     test_class_casted_as()
     test_jinja_tokens()
     #break